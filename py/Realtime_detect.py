@@ -4,13 +4,12 @@ import numpy as np
 import joblib
 from numpy.fft import rfft
 from serial_helper import open_serial, close_serial
-from config import COM_PORT, BAUD_RATE
+from config import COM_PORT, BAUD_RATE, MODEL_PATH
 
 # ==========================
 WINDOW_SIZE = 64
 FEATURE_COUNT = 16
 COOLDOWN = 1.0  # seconds
-MODEL_PATH = "clap_model.pkl"
 
 # ==========================
 def extract_features(signal):
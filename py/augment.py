@@ -0,0 +1,80 @@
+from collections.abc import Iterator
+
+import numpy as np
+
+from features import FEATURE_COUNT, WINDOW_SIZE, extract_features_batch
+
+ADC_MAX = 1023  # analogRead is 10-bit
+SNR_DB = (0.0, 30.0)  # clap power over background power, per window
+GAIN = (0.5, 2.0)  # mic sensitivity / distance
+MAX_OFFSET = 64.0  # baseline drift in ADC counts, either way
+CHUNK_SIZE = 50_000  # windows generated (and featurised) per step
+AUGMENTED_WINDOWS = 1_000_000  # default size of a training run
+SEED = 42
+
+
+def augment_batch(
+    rng: np.random.Generator,
+    clap: np.ndarray,
+    noise: np.ndarray,
+    n: int,
+    window_size: int = WINDOW_SIZE,
+    snr_db: tuple[float, float] = SNR_DB,
+    gain: tuple[float, float] = GAIN,
+    max_offset: float = MAX_OFFSET,
+) -> tuple[np.ndarray, np.ndarray]:
+    """n synthetic windows, about half a recorded clap mixed into recorded noise (label 1).
+
+    the rest are noise only (label 0). both get the same random gain, baseline
+    offset and clipping to the ADC range, so the label is the only difference.
+    """
+    baseline = np.median(noise)
+    noise_ac = noise - baseline
+    clap_ac = clap - baseline
+    labels = rng.random(n) < 0.5
+
+    # background: a random stretch of the noise recording, wrapping round if it's short
+    starts = rng.integers(0, len(noise), n)
+    background = noise_ac[(starts[:, None] + np.arange(window_size)) % len(noise)]
+
+    # foreground: the clap time-shifted so at least half of it lands in the window
+    half = len(clap) // 2
+    shift = rng.integers(-half, window_size - half, n)
+    position = np.arange(window_size) - shift[:, None]
+    inside = (position >= 0) & (position < len(clap))
+    foreground = np.where(inside, clap_ac[np.clip(position, 0, len(clap) - 1)], 0.0)
+
+    # scale the clap to the drawn SNR against this window's background.
+    # floor the noise power at one ADC count so silent backgrounds still get a clap.
+    noise_power = np.maximum(np.mean(background**2, axis=1), 1.0)
+    clap_power = max(float(np.mean(clap_ac**2)), 1e-12)
+    snr = rng.uniform(*snr_db, n)
+    scale = np.sqrt(noise_power * 10 ** (snr / 10) / clap_power) * labels
+
+    mix = background + scale[:, None] * foreground
+    mix *= rng.uniform(*gain, n)[:, None]
+    mix += baseline + rng.uniform(-max_offset, max_offset, n)[:, None]
+    return np.clip(np.rint(mix), 0, ADC_MAX), labels.astype(int)
+
+
+def augmented_features(
+    clap: np.ndarray,
+    noise: np.ndarray,
+    total: int,
+    chunk_size: int = CHUNK_SIZE,
+    window_size: int = WINDOW_SIZE,
+    feature_count: int = FEATURE_COUNT,
+    seed: int | None = None,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """yield (features, labels) a chunk at a time, so only one chunk of windows exists at once.
+
+    the same seed always gives the same chunks.
+    """
+    rng = np.random.default_rng(seed)
+    clap = np.asarray(clap, dtype=np.float64)
+    noise = np.asarray(noise, dtype=np.float64)
+    for start in range(0, total, chunk_size):
+        windows, labels = augment_batch(
+            rng, clap, noise, min(chunk_size, total - start), window_size
+        )
+        yield extract_features_batch(windows, feature_count), labels
@@ -21,10 +21,12 @@ from source import (
     open_serial_data,
 )
 from utils import  error
+from augment import AUGMENTED_WINDOWS, SEED
+from config import CLAP_DATA, COOLDOWN, MODEL_PATH, NOISE_DATA
+from evaluate import TOLERANCE
+from features import FEATURE_COUNT, WINDOW_SIZE
 
 
-WINDOW_SIZE = 256
-FEATURE_COUNT: int = 20
 REPO_URL = "https://github.com/antiah-arch/EchoSafe"
 
 
@@ -37,12 +39,25 @@ class Record:
 class Train:
     window_size: int
     feature_count: int
+    clap: str
+    noise: str
+    windows: int
+    seed: int
 
 @dataclass(frozen=True)
 class Run:
     pass
 
-Command = Train | Record | Run
+@dataclass(frozen=True)
+class Evaluate:
+    recordings: tuple[str, ...]
+    jobs: int | None
+    window_size: int
+    feature_count: int
+    cooldown: float
+    tolerance: float
+
+Command = Train | Record | Run | Evaluate
 
 
 def parse_serial_path(stream: Iterator[str]) -> SerialSource:
@@ -127,11 +142,27 @@ class Args:
         command: Command
         match raw.command:
             case "train":
-                command = Train(raw.window_size, raw.feature_count)
+                command = Train(
+                    raw.window_size,
+                    raw.feature_count,
+                    raw.clap,
+                    raw.noise,
+                    raw.windows,
+                    raw.seed,
+                )
             case "record":
                 command = Record(raw.seconds)
             case "run":
                 command = Run()
+            case "evaluate":
+                command = Evaluate(
+                    tuple(raw.recordings),
+                    raw.jobs,
+                    raw.window_size,
+                    raw.feature_count,
+                    raw.cooldown,
+                    raw.tolerance,
+                )
             case _:
                 error(f"unknown sub-command {raw.command}")
         return Args(source, output, verbose, command, model)
@@ -147,10 +178,10 @@ class Args:
                 return sys.stdout.buffer, False  # BinaryIO | Any
             case "file":
                 path = parse_file_path(stream).path
-                return open(path, "wb", errors="ignore"), True  # IO[Any]
+                return open(path, "wb"), True  # IO[Any]
             case "serial":
                 port = parse_serial_path(stream).port
-                return initiate_serial_connection(port), True  # pyserial.Serial
+                return initiate_serial_connection(port), True  # SerialConnection
             case _:
                 error("invalid output")
 
@@ -219,16 +250,30 @@ def parse_command_line() -> Args:
         default="recordings/recording.csv",
     )
 
-    train = subparsers.add_parser("train", parents=[shared])
+    train = subparsers.add_parser(
+        "train",
+        parents=[shared],
+        help="fit a model on augmented windows mixed from clap and noise recordings",
+    )
     train.add_argument("-f", "--feature-count", type=int, default=FEATURE_COUNT)
     train.add_argument("-w", "--window-size", type=int, default=WINDOW_SIZE)
     train.add_argument(
         "-m",
         "--model",
-        default="./models/model.tflite",
+        default=MODEL_PATH,
         metavar="MODEL_PATH",
-        help="tflite model file to use",
+        help="joblib model file to write",
+    )
+    train.add_argument("--clap", default=CLAP_DATA, metavar="CSV", help="clap recording")
+    train.add_argument("--noise", default=NOISE_DATA, metavar="CSV", help="background recording")
+    train.add_argument(
+        "-n",
+        "--windows",
+        type=int,
+        default=AUGMENTED_WINDOWS,
+        help="augmented windows to train on",
     )
+    train.add_argument("--seed", type=int, default=SEED)
     train.add_argument(
         "-o",
         "--output",
@@ -237,5 +282,46 @@ def parse_command_line() -> Args:
         help="where to output data, can be stdout | serial:COMPORT | file:PATH",
     )
 
+    evaluate = subparsers.add_parser(
+        "evaluate",
+        parents=[shared],
+        help="score a saved model on labelled recordings at the event level",
+    )
+    evaluate.add_argument(
+        "recordings",
+        nargs="+",
+        metavar="CSV",
+        help="labelled recordings with time,mic_value,label columns",
+    )
+    evaluate.add_argument(
+        "-m",
+        "--model",
+        default=MODEL_PATH,
+        metavar="MODEL_PATH",
+        help="joblib model file written by the trainer",
+    )
+    evaluate.add_argument("-f", "--feature-count", type=int, default=FEATURE_COUNT)
+    evaluate.add_argument("-w", "--window-size", type=int, default=WINDOW_SIZE)
+    evaluate.add_argument(
+        "-j", "--jobs", type=int, default=None, help="worker processes, one file each"
+    )
+    evaluate.add_argument(
+        "-c", "--cooldown", type=float, default=COOLDOWN, metavar="SECONDS"
+    )
+    evaluate.add_argument(
+        "--tolerance",
+        type=float,
+        default=TOLERANCE,
+        metavar="SECONDS",
+        help="how long after an event ends a detection still counts for it",
+    )
+    evaluate.add_argument(
+        "-o",
+        "--output",
+        default="stdout",
+        metavar="OUTPUT",
+        help="where to write the report, can be stdout | file:PATH",
+    )
+
     parsed = parser.parse_args()
     return Args.from_parsed_args(parsed)
@@ -1,3 +1,5 @@
+import os
+
 # Serial communication settings
 COM_PORT = "COM3"  # Change to your COM port
 BAUD_RATE = 9600
@@ -7,4 +9,15 @@ WINDOW_SIZE = 512
 NUM_FEATURES = 13
 
 # Cooldown period between detections (in seconds)
-COOLDOWN = 1.0
\ No newline at end of file
+COOLDOWN = 1.0
+
+# Model written by the trainer and loaded by the detectors
+MODEL_PATH = "clap_model.pkl"
+
+# Recordings the augmenter mixes training windows from, found relative to this
+# file so training works from any directory
+TRAINING_DATA = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), "..", "training_data")
+)
+CLAP_DATA = os.path.join(TRAINING_DATA, "sound_data_label1.csv")
+NOISE_DATA = os.path.join(TRAINING_DATA, "sound_data_label0.csv")
@@ -0,0 +1,278 @@
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from config import COOLDOWN, MODEL_PATH
+from features import (
+    FEATURE_COUNT,
+    WINDOW_SIZE,
+    check_window_settings,
+    extract_features_batch,
+    sliding_windows,
+)
+from source import MIC_VALUE_LABEL, QUANTITY_LABEL, TIME_LABEL
+from utils import error
+
+TOLERANCE = 0.25  # seconds after an event ends that a trigger still counts for it
+CHUNK_SIZE = 1 << 16  # rows read (and windows scored) at a time per file
+
+
+@dataclass(frozen=True)
+class FileReport:
+    path: str
+    duration: float  # seconds
+    events: int
+    detected: int
+    false_alarms: int
+    latencies: np.ndarray = field(repr=False)  # seconds, one per detected event
+
+
+@dataclass(frozen=True)
+class Report:
+    files: list[FileReport]
+
+    @property
+    def hours(self) -> float:
+        return sum(f.duration for f in self.files) / 3600
+
+    @property
+    def events(self) -> int:
+        return sum(f.events for f in self.files)
+
+    @property
+    def detected(self) -> int:
+        return sum(f.detected for f in self.files)
+
+    @property
+    def false_alarms(self) -> int:
+        return sum(f.false_alarms for f in self.files)
+
+    @property
+    def recall(self) -> float:
+        return self.detected / self.events if self.events else float("nan")
+
+    @property
+    def false_alarms_per_hour(self) -> float:
+        return self.false_alarms / self.hours if self.hours else float("nan")
+
+    @property
+    def latencies(self) -> np.ndarray:
+        return np.concatenate([f.latencies for f in self.files] or [np.empty(0)])
+
+    def to_text(self) -> str:
+        lines = [
+            f"files: {len(self.files)}  audio: {self.hours:.2f} h",
+            f"events: {self.detected}/{self.events} detected  recall: {self.recall * 100:.2f}%",
+            f"false alarms: {self.false_alarms} ({self.false_alarms_per_hour:.2f} / hour)",
+        ]
+        latencies = self.latencies * 1000
+        if len(latencies):
+            p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+            lines.append(
+                f"latency ms: mean {latencies.mean():.1f}  p50 {p50:.1f}  "
+                f"p90 {p90:.1f}  p99 {p99:.1f}  max {latencies.max():.1f}"
+            )
+        for f in self.files:
+            lines.append(
+                f"  {f.path}: {f.detected}/{f.events} events, "
+                f"{f.false_alarms} false alarms, {f.duration:.1f}s"
+            )
+        return "\n".join(lines) + "\n"
+
+
+def apply_cooldown(
+    times: np.ndarray, cooldown: float, last_trigger: float
+) -> tuple[np.ndarray, float]:
+    """same rule as the realtime loop: fire only if more than `cooldown` since the last fire.
+
+    jumps straight to the next eligible positive so it only loops once per trigger.
+    """
+    triggers: list[float] = []
+    i = int(np.searchsorted(times, last_trigger + cooldown, side="right"))
+    while i < len(times):
+        last_trigger = float(times[i])
+        triggers.append(last_trigger)
+        i = int(np.searchsorted(times, last_trigger + cooldown, side="right"))
+    return np.array(triggers), last_trigger
+
+
+def match_events(
+    starts: np.ndarray, ends: np.ndarray, triggers: np.ndarray, tolerance: float
+) -> tuple[np.ndarray, int]:
+    """returns (latency of each detected event, number of triggers outside every event).
+
+    an event's window runs from its start to end + tolerance, cut short where the
+    next event starts, so one trigger is never credited to two events.
+    """
+    if len(starts) == 0:
+        return np.empty(0), len(triggers)
+    next_starts = np.append(starts[1:], np.inf)
+    # first trigger at or after each event start
+    first = np.searchsorted(triggers, starts, side="left")
+    has_trigger = first < len(triggers)
+    candidate = triggers[np.minimum(first, len(triggers) - 1)] if len(triggers) else starts
+    hit = has_trigger & (candidate <= ends + tolerance) & (candidate < next_starts)
+    latencies = (candidate - starts)[hit]
+
+    # a trigger is a true positive if it falls in the latest event that started before it
+    owner = np.searchsorted(starts, triggers, side="right") - 1
+    inside = (owner >= 0) & (triggers <= ends[np.maximum(owner, 0)] + tolerance)
+    return latencies, int(np.count_nonzero(~inside))
+
+
+def _checked_chunks(path: str, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """re-raise pandas' parse errors with the file name, they don't say which file."""
+    try:
+        yield from chunks
+    except ValueError as e:  # includes pandas ParserError and EmptyDataError
+        raise ValueError(f"{path}: {e}") from e
+
+
+def check_recording_header(path: str) -> None:
+    try:
+        columns = pd.read_csv(path, nrows=0).columns
+    except ValueError as e:
+        error(f"{path}: {e}")
+    missing = [
+        c for c in (TIME_LABEL, MIC_VALUE_LABEL, QUANTITY_LABEL) if c not in columns
+    ]
+    if missing:
+        error(f"{path}: missing column(s) {', '.join(missing)}")
+
+
+def evaluate_file(
+    path: str,
+    model: object,
+    window_size: int = WINDOW_SIZE,
+    feature_count: int = FEATURE_COUNT,
+    cooldown: float = COOLDOWN,
+    tolerance: float = TOLERANCE,
+    chunk_size: int = CHUNK_SIZE,
+) -> FileReport:
+    """stream a labelled recording through the model chunk by chunk.
+
+    the last window_size - 1 samples are carried between chunks so every sample
+    gets exactly the window the realtime deque would have held.
+    """
+    carry_values = np.empty(0)
+    carry_times = np.empty(0)
+    last_trigger = -np.inf
+    triggers: list[np.ndarray] = []
+    starts: list[np.ndarray] = []
+    ends: list[np.ndarray] = []
+    previous_label = False
+    previous_time = np.nan
+    first_time = np.nan
+
+    chunks = pd.read_csv(
+        path,
+        usecols=[TIME_LABEL, MIC_VALUE_LABEL, QUANTITY_LABEL],
+        dtype=np.float64,
+        chunksize=chunk_size,
+    )
+    for chunk in _checked_chunks(path, chunks):
+        times = chunk[TIME_LABEL].to_numpy()
+        values = chunk[MIC_VALUE_LABEL].to_numpy()
+        labels = chunk[QUANTITY_LABEL].to_numpy() > 0.5
+        if len(times) == 0:
+            continue
+        if np.isnan(first_time):
+            first_time = times[0]
+
+        # label edges, with the previous chunk's last sample in front
+        edges = np.diff(np.concatenate(([previous_label], labels)).astype(np.int8))
+        starts.append(times[edges == 1])
+        ends.append(np.concatenate(([previous_time], times))[:-1][edges == -1])
+        previous_label = bool(labels[-1])
+        previous_time = times[-1]
+
+        stream = np.concatenate((carry_values, values))
+        stream_times = np.concatenate((carry_times, times))
+        windows = sliding_windows(stream, window_size)
+        if len(windows):
+            predictions = model.predict(extract_features_batch(windows, feature_count))
+            positive = stream_times[window_size - 1 :][predictions == 1]
+            fired, last_trigger = apply_cooldown(positive, cooldown, last_trigger)
+            triggers.append(fired)
+        keep = max(len(stream) - (window_size - 1), 0)
+        carry_values = stream[keep:]
+        carry_times = stream_times[keep:]
+
+    if previous_label:
+        ends.append(np.array([previous_time]))
+
+    event_starts = np.concatenate(starts or [np.empty(0)])
+    event_ends = np.concatenate(ends or [np.empty(0)])
+    all_triggers = np.concatenate(triggers or [np.empty(0)])
+    latencies, false_alarms = match_events(
+        event_starts, event_ends, all_triggers, tolerance
+    )
+    duration = 0.0 if np.isnan(first_time) else float(previous_time - first_time)
+    return FileReport(
+        path, duration, len(event_starts), len(latencies), false_alarms, latencies
+    )
+
+
+_worker_model: object = None
+
+
+def _load_worker_model(model_path: str) -> None:
+    global _worker_model
+    _worker_model = joblib.load(model_path)
+
+
+def _evaluate_in_worker(path: str, **settings) -> FileReport:
+    return evaluate_file(path, _worker_model, **settings)
+
+
+def evaluate(
+    model_path: str,
+    recordings: Iterable[str],
+    jobs: int | None = None,
+    window_size: int = WINDOW_SIZE,
+    feature_count: int = FEATURE_COUNT,
+    cooldown: float = COOLDOWN,
+    tolerance: float = TOLERANCE,
+) -> Report:
+    """score every recording, one process per file, and pool the results."""
+    recordings = list(recordings)
+    if jobs is not None and jobs < 1:
+        error(f"--jobs must be at least 1, got {jobs}")
+    check_window_settings(window_size, feature_count)
+    if cooldown < 0 or tolerance < 0:
+        error("--cooldown and --tolerance can't be negative")
+    for path in [model_path, *recordings]:
+        if not os.path.exists(path):
+            error(f"file {path} does not exist")
+    for path in recordings:
+        check_recording_header(path)
+
+    settings = dict(
+        window_size=window_size,
+        feature_count=feature_count,
+        cooldown=cooldown,
+        tolerance=tolerance,
+    )
+    try:
+        if jobs == 1 or len(recordings) == 1:
+            model = joblib.load(model_path)
+            return Report(
+                [evaluate_file(path, model, **settings) for path in recordings]
+            )
+
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_load_worker_model,
+            initargs=(model_path,),
+        ) as pool:
+            files = list(pool.map(partial(_evaluate_in_worker, **settings), recordings))
+        return Report(files)
+    except ValueError as e:
+        # a bad row part way through a file only shows up while it's being read
+        error(str(e))
@@ -0,0 +1,45 @@
+import numpy as np
+from numpy.fft import rfft
+from numpy.lib.stride_tricks import sliding_window_view
+
+from utils import error
+
+FEATURE_COUNT = 16
+WINDOW_SIZE = 64
+
+
+def extract_features_batch(
+    windows: np.ndarray, feature_count: int = FEATURE_COUNT
+) -> np.ndarray:
+    """FFT features for a (n, window) array of windows, one row per window.
+
+    column i is the mean of fft_vals[i::feature_count], the same features
+    Realtime_detect.extract_features computes for a single window.
+    """
+    fft_vals = np.abs(rfft(windows, axis=-1))
+    bins = fft_vals.shape[-1]
+    sums = np.zeros((len(fft_vals), feature_count))
+    for start in range(0, bins, feature_count):
+        block = fft_vals[:, start : start + feature_count]
+        sums[:, : block.shape[1]] += block
+    counts = np.bincount(np.arange(bins) % feature_count, minlength=feature_count)
+    return sums / counts
+
+
+def sliding_windows(signal: np.ndarray, window_size: int = WINDOW_SIZE) -> np.ndarray:
+    """every window the realtime deque would see, one per incoming sample."""
+    if len(signal) < window_size:
+        return np.empty((0, window_size), dtype=signal.dtype)
+    return sliding_window_view(signal, window_size)
+
+
+def check_window_settings(window_size: int, feature_count: int) -> None:
+    """every feature needs at least one FFT bin to average, or it comes out NaN."""
+    if window_size < 1:
+        error(f"--window-size must be at least 1, got {window_size}")
+    bins = window_size // 2 + 1
+    if not 1 <= feature_count <= bins:
+        error(
+            f"--feature-count must be between 1 and {bins} "
+            f"(the FFT bins in a {window_size} sample window), got {feature_count}"
+        )
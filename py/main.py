@@ -1,26 +1,67 @@
-from cli import Args, Record, Train, parse_command_line
+import joblib
+
+from cli import Args, Evaluate, Record, Train, parse_command_line
+from evaluate import evaluate
 from recording import record
-from trainer import initialize_model, train
+
+
+def write_report(args: Args, text: str) -> None:
+    output, can_close_output = args.open_output()
+    output.write(text.encode())
+    if can_close_output:
+        output.close()
 
 
 def main():
     args: Args = parse_command_line()
-    source = args.open_source()
-    output, can_close_output = args.open_output()
+    # train and evaluate work on recordings only, no live source to open
     match args.command:
+        case command if isinstance(command, Evaluate):
+            report = evaluate(
+                args.model,
+                command.recordings,
+                command.jobs,
+                command.window_size,
+                command.feature_count,
+                command.cooldown,
+                command.tolerance,
+            )
+            write_report(args, report.to_text())
+            return
         case command if isinstance(command, Train):
-            interpreter = initialize_model(args.model)
+            # trainer pulls in the training stack, only load it when training
+            from trainer import augmented_holdout_accuracy, load_signal, train_augmented
 
-            train(
-                interpreter,
-                output,
+            clap = load_signal(command.clap)
+            noise = load_signal(command.noise)
+            model = train_augmented(
+                clap,
+                noise,
+                command.windows,
                 command.window_size,
                 command.feature_count,
-                source.iterator,
+                command.seed,
             )
-            # open source Iterator[DataEntry]
-            # pass to training function
-            # finish
+            accuracy = augmented_holdout_accuracy(
+                model,
+                clap,
+                noise,
+                window_size=command.window_size,
+                feature_count=command.feature_count,
+                seed=command.seed + 1,
+            )
+            joblib.dump(model, args.model)
+            write_report(
+                args,
+                f"trained on {command.windows} augmented windows, "
+                f"augmented holdout accuracy {accuracy * 100:.2f}%\n"
+                f"saved model to {args.model}\n",
+            )
+            return
+
+    source = args.open_source()
+    output, can_close_output = args.open_output()
+    match args.command:
         case command if isinstance(command, Record):
             record(output, source.iterator, command.seconds)
             pass
@@ -29,7 +70,6 @@ def main():
     source.close()
     if can_close_output:
         output.close()
-    # interpretor = initialize_model(args.model)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,158 @@
 import serial
 import time
 import sys
+from dataclasses import dataclass, field
+
+from utils import subtext, success, warning
+
+READY_BANNER = b"Arduino ready!"  # printed by safe_serical.ino in setup()
+READY_TIMEOUT = 3.0  # seconds to wait for the banner or a first sample
+CONNECT_TIMEOUT = 10.0  # seconds to keep retrying the very first connect
+INITIAL_BACKOFF = 0.1
+MAX_BACKOFF = 5.0
+READY_POLL = 0.05  # read timeout while waiting for the device to come up
+
+
+@dataclass
+class SerialStats:
+    reconnects: int = 0
+    # seconds from opening the port to the first valid sample, one per connection
+    time_to_first_sample: list[float] = field(default_factory=list)
+
+
+class SerialConnection:
+    """Serial port that waits for the device to say it's ready and reconnects on failure.
+
+    readline/write/close mirror pyserial, so it drops in wherever a Serial was used.
+    """
+
+    def __init__(
+        self,
+        port: str,
+        baud: int,
+        timeout: float = 1,
+        ready_timeout: float = READY_TIMEOUT,
+        connect_timeout: float | None = CONNECT_TIMEOUT,
+        max_backoff: float = MAX_BACKOFF,
+    ):
+        self.port = port
+        self.baud = baud
+        self.timeout = timeout
+        self.ready_timeout = ready_timeout
+        self.max_backoff = max_backoff
+        self.stats = SerialStats()
+        self.ser: serial.Serial | None = None
+        self._pending: bytes | None = None  # first sample seen while waiting for ready
+        self._opened_at = 0.0
+        self._awaiting_sample = False
+        deadline = None if connect_timeout is None else time.monotonic() + connect_timeout
+        self.connect(deadline)
+
+    @property
+    def is_open(self) -> bool:
+        return self.ser is not None and self.ser.is_open
+
+    def connect(self, deadline: float | None = None) -> None:
+        """open and wait for ready, backing off between attempts until deadline (None = forever)."""
+        backoff = INITIAL_BACKOFF
+        while True:
+            try:
+                self._open(deadline)
+                return
+            except (serial.SerialException, OSError) as e:
+                self._drop()
+                if deadline is not None and time.monotonic() + backoff > deadline:
+                    raise serial.SerialException(f"{self.port} not ready: {e}") from e
+                warning(f"{self.port} unavailable ({e}), retrying in {backoff:.1f}s")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+
+    def _open(self, deadline: float | None) -> None:
+        self._opened_at = time.monotonic()
+        self._awaiting_sample = True
+        self._pending = None
+        self.ser = serial.Serial(self.port, self.baud, timeout=READY_POLL)
+        ready_by = self._opened_at + self.ready_timeout
+        self._wait_ready(ready_by if deadline is None else min(ready_by, deadline))
+        self.ser.timeout = self.timeout
+
+    def _wait_ready(self, ready_by: float) -> None:
+        """read until the banner or a numeric frame shows up; anything else is reset noise.
+
+        the short poll timeout can cut a line in two, so only whole lines count.
+        """
+        partial = b""
+        while time.monotonic() < ready_by:
+            partial += self.ser.readline()
+            if not partial.endswith(b"\n"):
+                continue
+            line, partial = partial, b""
+            frame = line.strip()
+            if frame == READY_BANNER:
+                return
+            if frame.isdigit():
+                self._note_sample(frame)
+                self._pending = line
+                return
+        raise serial.SerialException("no ready banner or sample from device")
+
+    def _note_sample(self, frame: bytes) -> None:
+        if self._awaiting_sample and frame.isdigit():
+            self._awaiting_sample = False
+            self.stats.time_to_first_sample.append(time.monotonic() - self._opened_at)
+
+    def _drop(self) -> None:
+        if self.ser is not None:
+            try:
+                self.ser.close()
+            except (serial.SerialException, OSError):
+                pass
+        self.ser = None
+
+    def _reconnect(self, e: Exception) -> None:
+        warning(f"lost {self.port} ({e}), reconnecting...")
+        self._drop()
+        self.stats.reconnects += 1
+        self.connect()
+        success(f"reconnected to {self.port}")
+
+    def readline(self) -> bytes:
+        """like Serial.readline, but a disconnect reconnects instead of raising."""
+        while True:
+            if self._pending is not None:
+                line, self._pending = self._pending, None
+                return line
+            try:
+                line = self.ser.readline()
+            except (serial.SerialException, OSError) as e:
+                self._reconnect(e)
+                continue
+            self._note_sample(line.strip())
+            return line
+
+    def write(self, data: bytes) -> int | None:
+        """like Serial.write, but a disconnect reconnects and retries instead of raising."""
+        while True:
+            try:
+                return self.ser.write(data)
+            except (serial.SerialException, OSError) as e:
+                self._reconnect(e)
+
+    def close(self) -> None:
+        if self.is_open:
+            ttfs = self.stats.time_to_first_sample
+            first = f"{ttfs[-1] * 1000:.0f}ms" if ttfs else "n/a"
+            subtext(
+                f"{self.port}: reconnects {self.stats.reconnects}, "
+                f"time to first sample {first}"
+            )
+        self._drop()
+
 
 def open_serial(port, baud):
-    """Open serial safely; exit if port is busy."""
+    """Open serial once the device reports ready; exit if it never does."""
     try:
-        ser = serial.Serial(port, baud, timeout=1)
-        time.sleep(2)  # give Arduino time to reset
-        return ser
+        return SerialConnection(port, baud)
     except serial.SerialException as e:
         print(f" Could not open {port}: {e}")
         sys.exit(1)
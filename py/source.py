@@ -5,7 +5,8 @@ from io import TextIOWrapper
 from time import time
 from typing import cast
 
-from serial import Serial
+from serial import SerialException
+from serial_helper import SerialConnection
 from utils import error, success, warning
 
 BAUDRATE = 115200  # speed of communication over connection in baud
@@ -123,8 +124,11 @@ class DataEntry:
         # filter(lambda mic: not mic.isdigit(), microphone_values),
 
 
-def initiate_serial_connection(com_port: str) -> Serial:
-    serial_connection = Serial(com_port, BAUDRATE, timeout=1)
+def initiate_serial_connection(com_port: str) -> SerialConnection:
+    try:
+        serial_connection = SerialConnection(com_port, BAUDRATE)
+    except SerialException as e:
+        error(f"could not connect to device on port {com_port}: {e}")
     success(f"connected to device on port {com_port}")
     return serial_connection
 
@@ -133,7 +137,7 @@ def open_microphone_data(microphone_raw: str) -> Iterator[DataEntry]:
     error("microphone not implemented")
 
 
-def open_serial_data(serial_connection: Serial) -> Iterator[DataEntry]:
+def open_serial_data(serial_connection: SerialConnection) -> Iterator[DataEntry]:
     microphone_values: Iterator[str] = iter(
         lambda: serial_connection.readline().decode(errors="ignore").strip(), ""
     )
@@ -161,7 +165,7 @@ def open_file_data(lines: TextIOWrapper) -> Iterator[DataEntry]:
 @dataclass
 class DataStream:
     iterator: Iterator[DataEntry]
-    backer: TextIOWrapper | Serial
+    backer: TextIOWrapper | SerialConnection
 
     def close(self):
         self.backer.close()
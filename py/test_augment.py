@@ -0,0 +1,25 @@
+import numpy as np
+
+from augment import ADC_MAX, augment_batch, augmented_features
+
+CLAP = np.array([130, 140, 280, 420, 900, 1000, 700, 400, 200, 140], dtype=float)
+NOISE = np.array([122, 118, 120, 123, 119, 121], dtype=float)
+
+
+def test_same_seed_same_chunks():
+    first = list(augmented_features(CLAP, NOISE, 1000, 300, seed=7))
+    second = list(augmented_features(CLAP, NOISE, 1000, 300, seed=7))
+    assert [len(y) for _, y in first] == [300, 300, 300, 100]
+    for (X1, y1), (X2, y2) in zip(first, second):
+        assert np.array_equal(X1, X2) and np.array_equal(y1, y2)
+
+
+def test_windows_look_like_adc_samples():
+    windows, labels = augment_batch(np.random.default_rng(0), CLAP, NOISE, 2000)
+    assert windows.shape == (2000, 64)
+    assert windows.min() >= 0 and windows.max() <= ADC_MAX
+    assert np.array_equal(windows, np.rint(windows))
+    assert set(labels.tolist()) == {0, 1}
+    # claps stand out from the background they were mixed into
+    spread = windows.max(axis=1) - windows.min(axis=1)
+    assert np.median(spread[labels == 1]) > np.median(spread[labels == 0])
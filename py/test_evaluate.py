@@ -0,0 +1,120 @@
+import joblib
+import numpy as np
+import pytest
+
+from evaluate import apply_cooldown, evaluate, evaluate_file, match_events
+
+INF = np.inf
+
+
+@pytest.mark.parametrize(
+    "times, cooldown, last_trigger, expected",
+    [
+        # a positive inside the cooldown is suppressed
+        ([0.0, 0.5, 1.2], 1.0, -INF, [0.0, 1.2]),
+        # exactly one cooldown later is still suppressed, the realtime loop uses >
+        ([0.0, 1.0], 1.0, -INF, [0.0]),
+        # the cooldown carries over from the previous chunk
+        ([0.3, 1.6], 1.0, 0.5, [1.6]),
+        ([], 1.0, -INF, []),
+    ],
+)
+def test_apply_cooldown(times, cooldown, last_trigger, expected):
+    fired, last = apply_cooldown(np.array(times), cooldown, last_trigger)
+    assert fired.tolist() == expected
+    assert last == (expected[-1] if expected else last_trigger)
+
+
+@pytest.mark.parametrize(
+    "starts, ends, triggers, latencies, false_alarms",
+    [
+        # trigger in the tolerance tail counts as a hit
+        ([1.0], [1.1], [1.3], [0.3], 0),
+        # past the tail it's a miss and a false alarm
+        ([1.0], [1.1], [1.5], [], 1),
+        # before the first event is a false alarm, the later one still hits
+        ([1.0], [1.1], [0.5, 1.05], [0.05], 1),
+        # a double clap: the trigger sits in the first event's tail but the second
+        # event has started, so it only counts for the second
+        ([1.0, 1.2], [1.1, 1.3], [1.25], [0.05], 0),
+        # only the first trigger sets the latency, the second is not a false alarm
+        ([1.0, 3.0], [1.2, 3.2], [1.1, 1.2, 3.0], [0.1, 0.0], 0),
+        ([], [], [0.2], [], 1),
+        ([1.0], [1.1], [], [], 0),
+    ],
+)
+def test_match_events(starts, ends, triggers, latencies, false_alarms):
+    got_latencies, got_false_alarms = match_events(
+        np.array(starts), np.array(ends), np.array(triggers), tolerance=0.25
+    )
+    assert got_latencies == pytest.approx(latencies)
+    assert got_false_alarms == false_alarms
+
+
+class LoudModel:
+    """fires whenever the window's mean spectrum is above a loud background."""
+
+    def predict(self, features):
+        return (features[:, 0] > 1000).astype(int)
+
+
+def write_recording(path, labels):
+    values = np.where(np.array(labels) == 1, 900, 100)
+    with open(path, "w") as f:
+        f.write("time,mic_value,label\n")
+        for i, (value, label) in enumerate(zip(values, labels)):
+            f.write(f"{i / 1000:.3f},{value},{label}\n")
+
+
+@pytest.mark.parametrize("chunk_size", [3, 5, 7, 1000])
+def test_event_across_chunk_boundary(tmp_path, chunk_size):
+    path = tmp_path / "rec.csv"
+    write_recording(path, [0] * 6 + [1] * 8 + [0] * 6)
+    report = evaluate_file(
+        str(path), LoudModel(), window_size=4, feature_count=1, chunk_size=chunk_size
+    )
+    assert (report.events, report.detected, report.false_alarms) == (1, 1, 0)
+    # two loud samples in the window are enough to clear the threshold
+    assert report.latencies == pytest.approx([0.001])
+
+
+@pytest.mark.parametrize("chunk_size", [4, 1000])
+def test_event_open_at_end_of_file(tmp_path, chunk_size):
+    path = tmp_path / "rec.csv"
+    write_recording(path, [0] * 6 + [1] * 6)
+    report = evaluate_file(
+        str(path), LoudModel(), window_size=4, feature_count=1, chunk_size=chunk_size
+    )
+    assert (report.events, report.detected) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    "rows, message",
+    [
+        ("time,mic_value\n0.000,100\n", "missing column(s) label"),
+        ("time,mic_value,label\n0.000,100,0\n0.001,x,0\n", "rec.csv: "),
+    ],
+)
+def test_evaluate_reports_bad_recordings(tmp_path, capsys, rows, message):
+    path = tmp_path / "rec.csv"
+    path.write_text(rows)
+    model = tmp_path / "model.pkl"
+    joblib.dump(LoudModel(), model)
+    with pytest.raises(SystemExit):
+        evaluate(str(model), [str(path)])
+    assert message in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        dict(jobs=0),
+        dict(jobs=-2),
+        dict(window_size=64, feature_count=34),
+        dict(feature_count=0),
+        dict(cooldown=-1.0),
+    ],
+)
+def test_evaluate_rejects_bad_settings(tmp_path, settings):
+    with pytest.raises(SystemExit):
+        evaluate(str(tmp_path / "model.pkl"), [], **settings)
@@ -0,0 +1,171 @@
+import os
+import select
+import threading
+import time
+
+import pytest
+
+pty = pytest.importorskip("pty")  # fake devices need a posix pseudo-terminal
+tty = pytest.importorskip("tty")
+serial = pytest.importorskip("serial")
+
+from serial_helper import SerialConnection
+
+RESET_DELAY = 0.2  # a real board resets when the port opens and only talks after
+
+
+class FakeDevice:
+    """an Arduino stand-in on a pty, reached through a symlink so it can be 'replugged'.
+
+    unplug() closes the pty, which the port sees as a disconnect; plug() makes a
+    fresh pty and re-points the symlink at it, like a USB device coming back.
+    """
+
+    def __init__(self, link: str):
+        self.link = link
+        self.received = bytearray()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._fds: tuple[int, int] | None = None
+
+    def plug(
+        self,
+        junk: bytes = b"",
+        banner: bool = True,
+        samples: bool = True,
+        pieces: tuple[bytes, ...] = (),
+    ):
+        """pieces are written with pauses longer than the port's poll, splitting reads."""
+        master, slave = pty.openpty()
+        tty.setraw(slave)
+        if os.path.lexists(self.link):
+            os.remove(self.link)
+        os.symlink(os.ttyname(slave), self.link)
+        self._fds = (master, slave)
+        self._stop.clear()
+
+        def run():
+            # the port flushes its input on open, so say nothing until after that
+            time.sleep(RESET_DELAY)
+            if junk:
+                os.write(master, junk)
+            for piece in pieces:
+                os.write(master, piece)
+                time.sleep(0.15)
+            if banner:
+                os.write(master, b"Arduino ready!\r\n")
+            i = 0
+            while samples and not self._stop.is_set():
+                os.write(master, f"{100 + i}\r\n".encode())
+                i += 1
+                time.sleep(0.005)
+
+        def listen():
+            # poll rather than block, a thread stuck in read keeps the pty alive
+            while not self._stop.is_set():
+                readable, _, _ = select.select([master], [], [], 0.02)
+                if not readable:
+                    continue
+                try:
+                    self.received += os.read(master, 64)
+                except OSError:
+                    return
+
+        self._threads = [threading.Thread(target=f, daemon=True) for f in (run, listen)]
+        for thread in self._threads:
+            thread.start()
+
+    def unplug(self):
+        self._stop.set()
+        master, slave = self._fds
+        os.close(slave)
+        for thread in self._threads:
+            thread.join()
+        os.close(master)
+        os.remove(self.link)
+
+
+@pytest.fixture
+def device(tmp_path):
+    fake = FakeDevice(str(tmp_path / "ttyFAKE"))
+    yield fake
+    if os.path.lexists(fake.link):
+        fake.unplug()
+
+
+def test_skips_reset_junk_until_banner(device):
+    device.plug(junk=b"\x00\xfe\xffgarbage\r\n12ab\r\n")
+    started = time.monotonic()
+    connection = SerialConnection(device.link, 115200)
+    assert time.monotonic() - started < 1
+    assert connection.readline().strip() == b"100"
+    assert len(connection.stats.time_to_first_sample) == 1
+    connection.close()
+
+
+def test_first_frame_counts_as_ready(device):
+    device.plug(banner=False)
+    connection = SerialConnection(device.link, 115200)
+    # the frame that proved readiness isn't lost
+    assert connection.readline().strip() == b"100"
+    connection.close()
+
+
+def test_banner_split_across_reads(device):
+    # safe_serical.ino only ever sends the banner, so it has to be put back together
+    device.plug(banner=False, samples=False, pieces=(b"Ardu", b"ino ready!\r\n"))
+    connection = SerialConnection(device.link, 115200)
+    assert connection.is_open
+    connection.close()
+
+
+def test_frame_split_across_reads_is_not_a_sample(device):
+    device.plug(banner=False, pieces=(b"1", b"23\r\n"))
+    connection = SerialConnection(device.link, 115200)
+    assert connection.readline() == b"123\r\n"
+    connection.close()
+
+
+def test_close_reports_stats(device, capsys):
+    device.plug()
+    connection = SerialConnection(device.link, 115200)
+    connection.close()
+    assert "reconnects 0, time to first sample" in capsys.readouterr().out
+
+
+def test_reconnects_after_replug(device):
+    device.plug()
+    connection = SerialConnection(device.link, 115200)
+    assert connection.readline().strip().isdigit()
+
+    device.unplug()
+    replug = threading.Timer(0.3, device.plug, kwargs=dict(banner=False))
+    replug.start()
+    lines = [connection.readline().strip() for _ in range(3)]
+    replug.join()
+
+    assert all(line.isdigit() for line in lines)
+    assert connection.stats.reconnects == 1
+    assert len(connection.stats.time_to_first_sample) == 2
+    connection.write(b"1")
+    connection.close()
+
+
+def test_write_reconnects_instead_of_raising(device):
+    device.plug()
+    connection = SerialConnection(device.link, 115200)
+    device.unplug()
+    device.plug()
+    connection.write(b"1")  # the old pty is gone, this has to reconnect
+    assert connection.stats.reconnects == 1
+    time.sleep(0.1)
+    assert b"1" in device.received
+    connection.close()
+
+
+def test_silent_device_times_out_within_connect_timeout(device):
+    device.plug(banner=False, samples=False)
+    started = time.monotonic()
+    with pytest.raises(serial.SerialException):
+        SerialConnection(device.link, 115200, ready_timeout=3.0, connect_timeout=1.0)
+    assert time.monotonic() - started < 1.5
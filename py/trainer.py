@@ -1,58 +1,91 @@
 import pandas as pd
 import numpy as np
-from numpy.fft import rfft
-from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import SGDClassifier
 from sklearn.metrics import accuracy_score
+from sklearn.pipeline import Pipeline, make_pipeline
+from sklearn.preprocessing import StandardScaler
 import joblib
-
-
-FEATURE_COUNT = 16
-WINDOW_SIZE = 64
-MODEL_OUT = "clap_model.pkl"
-
-
-def extract_features(signal: np.ndarray) -> np.ndarray:
-    fft_vals = np.abs(rfft(signal))
-    features = np.array(
-        [np.mean(fft_vals[i::FEATURE_COUNT]) for i in range(FEATURE_COUNT)]
+import os
+
+from augment import AUGMENTED_WINDOWS, CHUNK_SIZE, SEED, augmented_features
+from config import CLAP_DATA, MODEL_PATH, NOISE_DATA
+from features import FEATURE_COUNT, WINDOW_SIZE, check_window_settings
+from source import MIC_VALUE_LABEL
+from utils import error
+
+
+HOLDOUT_WINDOWS = 50_000
+
+
+def load_signal(path: str) -> np.ndarray:
+    if not os.path.exists(path):
+        error(f"file {path} does not exist")
+    return pd.read_csv(path)[MIC_VALUE_LABEL].to_numpy()
+
+
+def train_augmented(
+    clap: np.ndarray,
+    noise: np.ndarray,
+    windows: int = AUGMENTED_WINDOWS,
+    window_size: int = WINDOW_SIZE,
+    feature_count: int = FEATURE_COUNT,
+    seed: int = SEED,
+    chunk_size: int = CHUNK_SIZE,
+) -> Pipeline:
+    """fit on augmented windows streamed chunk by chunk, so the full set is never in memory.
+
+    the scaler is fitted on the first chunk, the classifier incrementally on all of them.
+    """
+    check_window_settings(window_size, feature_count)
+    if windows < 1:
+        error(f"--windows must be at least 1, got {windows}")
+    chunks = augmented_features(
+        clap, noise, windows, chunk_size, window_size, feature_count, seed=seed
     )
-    return features
-
-
-clap = pd.read_csv("sound_data_label1.csv")
-noise = pd.read_csv("sound_data_label0.csv")
-data = pd.concat([clap, noise]).reset_index(drop=True)
-
-
-X, y = [], []
-
-for label in [0, 1]:
-    subset = data[data["label"] == label]["mic_value"].values
-
-    for i in range(len(subset) - WINDOW_SIZE):
-        window = subset[i : i + WINDOW_SIZE]
-        features = extract_features(window)
-        X.append(features)
-        y.append(label)
-
-X = np.array(X)
-y = np.array(y)
-
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=0.2, random_state=42
-)
-
-
-model = LogisticRegression(max_iter=1000)
-model.fit(X_train, y_train)
+    scaler = StandardScaler()
+    model = SGDClassifier(loss="log_loss", random_state=seed)
+    for i, (X, y) in enumerate(chunks):
+        if i == 0:
+            scaler.fit(X)
+        model.partial_fit(scaler.transform(X), y, classes=[0, 1])
+    return make_pipeline(scaler, model)
+
+
+def augmented_holdout_accuracy(
+    model: Pipeline,
+    clap: np.ndarray,
+    noise: np.ndarray,
+    windows: int = HOLDOUT_WINDOWS,
+    window_size: int = WINDOW_SIZE,
+    feature_count: int = FEATURE_COUNT,
+    seed: int = SEED + 1,
+) -> float:
+    """accuracy on fresh augmented windows from another seed.
+
+    they come from the same clap and noise recordings as the training set, so this
+    measures fit to the augmenter, not how well the model does on new recordings.
+    use evaluate for that.
+    """
+    X, y = next(
+        augmented_features(
+            clap, noise, windows, windows, window_size, feature_count, seed=seed
+        )
+    )
+    return accuracy_score(y, model.predict(X))
 
 
-preds = model.predict(X_test)
-accuracy = accuracy_score(y_test, preds)
+def main():
+    clap = load_signal(CLAP_DATA)
+    noise = load_signal(NOISE_DATA)
+    model = train_augmented(clap, noise)
+    accuracy = augmented_holdout_accuracy(model, clap, noise)
+    print(
+        f"✅ Model accuracy: {accuracy * 100:.2f}% on {HOLDOUT_WINDOWS} augmented holdout windows"
+    )
 
-print(f"✅ Model accuracy: {accuracy * 100:.2f}%")
+    joblib.dump(model, MODEL_PATH)
+    print(f"💾 Saved model to {MODEL_PATH}")
 
 
-joblib.dump(model, MODEL_OUT)
-print(f"💾 Saved model to {MODEL_OUT}")
+if __name__ == "__main__":
+    main()